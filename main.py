@@ -1,7 +1,11 @@
 import asyncio
+import hashlib
+import logging
 import random
 import re
-from typing import Final, List, Dict, Any, Optional
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Final, Hashable, List, Optional
 
 from astrbot.api import logger
 from astrbot.api.event import filter, MessageChain
@@ -13,6 +17,30 @@ from astrbot.core.platform.sources.aiocqhttp.aiocqhttp_message_event import (
 )
 from astrbot.core.provider.provider import Provider
 
+
+@dataclass(slots=True)
+class _Cfg:
+    """热路径配置快照：事件处理中直接读属性，免去反复 dict 查找与校验"""
+
+    emoji_select_strategy: str
+    emoji_follow: float
+    emoji_like_prob: float
+    emoji_interval: float
+    default_emoji_num: int
+    judge_provider_id: str
+    judge_timeout: float
+    monitor_self: bool
+    # 黑白名单做成 frozenset，成员检查 O(1)
+    blacklist: frozenset[str]
+    whitelist: frozenset[str]
+    # 预解析的推送规则：(目标SID, 来源SID集合)，空集合表示全局推送
+    push_rules: list[tuple[str, frozenset[str]]]
+    msg_fold_threshold: int
+    operator_display_mode: str
+    group_display_mode: str
+    unmonitor_emoji_like_strategy: str
+
+
 @register("astrbot_plugin_emoji_sticker", "Singularity2000", "QQ群贴表情监控插件", "1.0.0", "https://github.com/Singularity2000/astrbot_plugin_emoji_sticker")
 class EmojiLikePlugin(Star):
     """
@@ -28,18 +56,96 @@ class EmojiLikePlugin(Star):
     # ---------- 1. 表情号段常量 ----------
     EMOJI_RANGE_START: Final[int] = 1  # 范围起点
     EMOJI_RANGE_END: Final[int] = 434  # 范围终点（不含）
+    LIKE_CONCURRENCY: Final[int] = 5  # 并发贴表情上限（每 interval 最多放行数）
+
+    # 推送规则格式：目标SID(前三段必含) 后可选冒号加来源列表，编译一次供所有事件复用
+    _PUSH_RE: Final = re.compile(r"^((?:[^:]+:){2}[^:]+)(?::(.*))?$")
+
+    # 元数据缓存参数：成员/群信息在分钟级内基本不变，缓存命中免去 OneBot RPC
+    MEMBER_CACHE_TTL: Final[float] = 300.0
+    MEMBER_CACHE_SIZE: Final[int] = 4096
+    GROUP_CACHE_TTL: Final[float] = 600.0
+    GROUP_CACHE_SIZE: Final[int] = 512
+    EMOTION_CACHE_SIZE: Final[int] = 2048  # LLM 情感判断结果缓存条数
 
     def __init__(self, context: Context, config: AstrBotConfig):
         super().__init__(context)
         self.config = config
 
+        # 热路径配置快照；配置变更后调用 _reload_cfg() 生效
+        self._reload_cfg()
+
         # 情感映射
         self.emotions_mapping: dict[str, list[int]] = self.parse_emotions_mapping_list(
             self.config.get("emotions_mapping", [])
         )
         self.emotion_keywords: list[str] = list(self.emotions_mapping.keys())
-        # 表情池
-        self.emoji_pool = list(range(self.EMOJI_RANGE_START, self.EMOJI_RANGE_END))
+        # 关键词合并编译为单个交替正则，一次线性扫描替代逐词 in 检查
+        self._emotion_re: re.Pattern[str] | None = (
+            re.compile("|".join(re.escape(k) for k in self.emotion_keywords))
+            if self.emotion_keywords
+            else None
+        )
+        # 表情池：range 本身就是支持索引/len 的惰性序列，无需物化成元组
+        self.emoji_pool: range = range(self.EMOJI_RANGE_START, self.EMOJI_RANGE_END)
+
+        # 群/成员元数据 TTL 缓存（key -> (过期时间, 数据)），命中时免去 OneBot RPC
+        self._member_cache: dict[tuple[int, int], tuple[float, dict]] = {}
+        self._group_cache: dict[int, tuple[float, dict]] = {}
+        # 按 key 加锁合并并发未命中，避免同一数据同时发多次 RPC
+        self._cache_locks: dict[Hashable, asyncio.Lock] = {}
+
+        # LLM 情感判断结果 LRU 缓存（key=文本摘要），同文重复触发时跳过 provider 调用
+        self._emotion_cache: dict[bytes, str] = {}
+        # 在途情感判断请求表：并发同文触发时合并为一次 provider 调用
+        self._inflight: dict[bytes, asyncio.Future[str]] = {}
+
+    def _reload_cfg(self) -> None:
+        """重建配置快照，集中做一次校验与预解析"""
+        cfg = self.config
+
+        default_num = cfg.get("default_emoji_num", 1)
+        if not isinstance(default_num, int) or default_num <= 0:
+            default_num = 1
+
+        fold_threshold = cfg.get("msg_fold_threshold", 0)
+        if not isinstance(fold_threshold, int) or fold_threshold <= 0:
+            fold_threshold = 0
+
+        # 推送规则只在快照时解析一次，格式问题也只在此告警一次
+        push_rules: list[tuple[str, frozenset[str]]] = []
+        for push_item in cfg.get("push_list", []):
+            match = self._PUSH_RE.match(push_item)
+            if not match:
+                logger.warning(f"[QQ群贴表情监控插件] 推送项格式不匹配: {push_item}")
+                continue
+            sources_part = match.group(2)
+            sources = (
+                frozenset(s.strip() for s in sources_part.split(","))
+                if sources_part
+                else frozenset()
+            )
+            push_rules.append((match.group(1), sources))
+
+        self._cfg = _Cfg(
+            emoji_select_strategy=cfg.get("emoji_select_strategy", "random"),
+            emoji_follow=cfg.get("emoji_follow", 0),
+            emoji_like_prob=cfg.get("emoji_like_prob", 0),
+            emoji_interval=cfg.get("emoji_interval", 0.5),
+            default_emoji_num=default_num,
+            judge_provider_id=cfg.get("judge_provider_id", ""),
+            judge_timeout=cfg.get("judge_timeout", 2.0),
+            monitor_self=cfg.get("monitor_self", False),
+            blacklist=frozenset(cfg.get("blacklist", [])),
+            whitelist=frozenset(cfg.get("whitelist", [])),
+            push_rules=push_rules,
+            msg_fold_threshold=fold_threshold,
+            operator_display_mode=cfg.get("operator_display_mode", "全部显示"),
+            group_display_mode=cfg.get("group_display_mode", "全部显示"),
+            unmonitor_emoji_like_strategy=cfg.get(
+                "unmonitor_emoji_like_strategy", "关闭监控取消贴表情事件"
+            ),
+        )
 
     @staticmethod
     def parse_emotions_mapping_list(
@@ -50,10 +156,13 @@ class EmojiLikePlugin(Star):
         """
         result: dict[str, list[int]] = {}
         for item in emotions_list:
+            emotion, sep, values = item.partition("：")
+            if not sep:
+                logger.warning(f"无法解析情感映射项: {item}")
+                continue
             try:
-                emotion, values = item.split("：", 1)
                 result[emotion.strip()] = list(map(int, values.split()))
-            except Exception:
+            except ValueError:
                 logger.warning(f"无法解析情感映射项: {item}")
         return result
 
@@ -66,7 +175,7 @@ class EmojiLikePlugin(Star):
         """
         表情选用策略入口
         """
-        strategy = self.config.get("emoji_select_strategy", "random")
+        strategy = self._cfg.emoji_select_strategy
 
         if strategy == "random":
             return self._select_random(need)
@@ -85,17 +194,20 @@ class EmojiLikePlugin(Star):
         emotion: str | None,
         need: int,
     ) -> list[int]:
-        if not emotion:
+        if not emotion or not self._emotion_re:
             return self._select_random(need)
 
-        for keyword in self.emotion_keywords:
-            if keyword in emotion:
-                pool = self.emotions_mapping.get(keyword)
-                if pool:
-                    selected = random.sample(pool, k=min(need, len(pool)))
-                    while len(selected) < need:
-                        selected.append(random.choice(self.emoji_pool))
-                    return selected
+        match = self._emotion_re.search(emotion)
+        if match:
+            pool = self.emotions_mapping.get(match.group(0))
+            if pool:
+                selected = random.sample(pool, k=min(need, len(pool)))
+                if len(selected) < need:
+                    # 从剩余表情中无放回补足：重复 ID 对 OneBot 是无效调用
+                    chosen = set(selected)
+                    remaining = [e for e in self.emoji_pool if e not in chosen]
+                    selected.extend(random.sample(remaining, k=need - len(selected)))
+                return selected
 
         return self._select_random(need)
 
@@ -105,28 +217,29 @@ class EmojiLikePlugin(Star):
         event: AiocqhttpMessageEvent,
         emojiNum: Optional[int] = None,
     ):
-        # 读取配置中的默认数量
-        default_num = self.config.get("default_emoji_num", 1)
-        if not isinstance(default_num, int) or default_num <= 0:
-            default_num = 1
-            
+        # 读取配置中的默认数量（快照时已校验为正整数）
+        default_num = self._cfg.default_emoji_num
+
+        # 显式分支校验，不用异常做控制流
         if emojiNum is None:
             emojiNum = default_num
+        elif isinstance(emojiNum, int) and emojiNum > 0:
+            pass
+        elif isinstance(emojiNum, str) and emojiNum.isdigit():
+            emojiNum = int(emojiNum) or 1
         else:
-            try:
-                emojiNum = int(emojiNum)
-                if emojiNum <= 0:
-                    emojiNum = 1
-            except:
-                emojiNum = 1
+            emojiNum = 1
 
         chain = event.get_messages()
         if not chain:
             return
 
-        reply = chain[0] if isinstance(chain[0], Reply) else None
-        if not reply or not reply.chain:
-            return
+        # 单个 match 完成类型判断 + 非空链校验，非引用回复直接退出
+        match chain[0]:
+            case Reply(chain=[_, *_]) as reply:
+                pass
+            case _:
+                return
 
         text = reply.text
         message_id = reply.id
@@ -136,7 +249,7 @@ class EmojiLikePlugin(Star):
             return
 
         emotion = None
-        if self.config.get("emoji_select_strategy") == "emotion_llm":
+        if self._cfg.emoji_select_strategy == "emotion_llm":
             emotion = await self.judge_emotion(event, text, images)
 
         need = min(emojiNum, 20)
@@ -147,16 +260,40 @@ class EmojiLikePlugin(Star):
 
         logger.info(f"贴表情: {emoji_ids}")
 
-        for emoji_id in emoji_ids:
-            await event.bot.set_msg_emoji_like(
-                message_id=message_id,
-                emoji_id=emoji_id,
-                set=True,
-            )
-            await asyncio.sleep(self.config.get("emoji_interval", 0.5))
+        # 并发贴表情：总耗时从 N*(RTT+interval) 降为约 max(RTT)+interval
+        # 信号量 + 间隔休眠构成简单令牌桶，保留限速效果
+        interval = self._cfg.emoji_interval
+        sem = asyncio.Semaphore(self.LIKE_CONCURRENCY)
+        await asyncio.gather(
+            *(
+                self._set_emoji_like(event, message_id, emoji_id, sem, interval)
+                for emoji_id in emoji_ids
+            ),
+            return_exceptions=True,
+        )
 
         event.stop_event()
 
+    async def _set_emoji_like(
+        self,
+        event: AiocqhttpMessageEvent,
+        message_id: str,
+        emoji_id: int,
+        sem: asyncio.Semaphore,
+        interval: float,
+    ) -> None:
+        """单次贴表情调用：限速且单个失败不影响同批其它表情"""
+        async with sem:
+            try:
+                await event.bot.set_msg_emoji_like(
+                    message_id=message_id,
+                    emoji_id=emoji_id,
+                    set=True,
+                )
+            except Exception as e:
+                logger.warning(f"贴表情失败 [表情{emoji_id}]: {e}")
+            await asyncio.sleep(interval)
+
     @filter.event_message_type(filter.EventMessageType.GROUP_MESSAGE)
     async def on_message(self, event: AiocqhttpMessageEvent):
         """群消息监听"""
@@ -171,24 +308,34 @@ class EmojiLikePlugin(Star):
         if event.is_at_or_wake_command:
             return
 
-        # 跟随已有表情
-        face_segs = [seg for seg in chain if isinstance(seg, Face)]
-        if face_segs and random.random() < self.config.get("emoji_follow", 0):
-            face = random.choice(face_segs)
-            try:
-                await event.bot.set_msg_emoji_like(
-                    message_id=event.message_obj.message_id,
-                    emoji_id=face.id,
-                    set=True,
-                )
-            except Exception as e:
-                logger.warning(f"表情跟随失败: {e}")
+        # 跟随已有表情：先掷概率，命中后才扫描消息链收集 Face 段
+        follow_p = self._cfg.emoji_follow
+        if follow_p > 0 and random.random() < follow_p:
+            face_segs = [seg for seg in chain if isinstance(seg, Face)]
+            if face_segs:
+                face = random.choice(face_segs)
+                try:
+                    await event.bot.set_msg_emoji_like(
+                        message_id=event.message_obj.message_id,
+                        emoji_id=face.id,
+                        set=True,
+                    )
+                except Exception as e:
+                    logger.warning(f"表情跟随失败: {e}")
 
         # 主动表情
-        if random.random() < self.config.get("emoji_like_prob", 0):
+        if random.random() < self._cfg.emoji_like_prob:
             emotion = None
-            if self.config.get("emoji_select_strategy") == "emotion_llm":
-                emotion = await self.judge_emotion(event, message_str)
+            if self._cfg.emoji_select_strategy == "emotion_llm":
+                # 限时等待情感判断：主动贴表情即便判断超时也只是回退随机，
+                # 不值得为它吃满一次 provider RTT
+                try:
+                    emotion = await asyncio.wait_for(
+                        self.judge_emotion(event, message_str),
+                        timeout=self._cfg.judge_timeout,
+                    )
+                except asyncio.TimeoutError:
+                    logger.debug("情感判断超时，回退随机表情")
 
             emoji_ids = self.select_emoji_ids(
                 emotion=emotion,
@@ -206,6 +353,66 @@ class EmojiLikePlugin(Star):
             except Exception as e:
                 logger.warning(f"设置表情失败: {e}")
 
+    async def _cached_fetch(
+        self,
+        cache: dict,
+        key: Hashable,
+        ttl: float,
+        maxsize: int,
+        fetch: Callable[[], Awaitable[dict]],
+    ) -> dict:
+        """带 TTL 的缓存读取；并发未命中按 key 加锁合并，只发一次 RPC"""
+        entry = cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # 双重检查：等锁期间可能已有协程填充
+                entry = cache.get(key)
+                now = time.monotonic()
+                if entry and entry[0] > now:
+                    return entry[1]
+
+                value = await fetch()
+
+                # 简单容量控制：先清过期项，仍超限则按插入序淘汰最旧
+                if len(cache) >= maxsize:
+                    for k in [k for k, (exp, _) in cache.items() if exp <= now]:
+                        del cache[k]
+                    while len(cache) >= maxsize:
+                        del cache[next(iter(cache))]
+
+                cache[key] = (now + ttl, value)
+                return value
+        finally:
+            self._cache_locks.pop(key, None)
+
+    async def _get_member_info(
+        self, event: AiocqhttpMessageEvent, group_id: int, user_id: int
+    ) -> dict:
+        """获取群成员信息（TTL 缓存）"""
+        return await self._cached_fetch(
+            self._member_cache,
+            (group_id, user_id),
+            self.MEMBER_CACHE_TTL,
+            self.MEMBER_CACHE_SIZE,
+            lambda: event.bot.get_group_member_info(group_id=group_id, user_id=user_id),
+        )
+
+    async def _get_group_info(
+        self, event: AiocqhttpMessageEvent, group_id: int
+    ) -> dict:
+        """获取群信息（TTL 缓存）"""
+        return await self._cached_fetch(
+            self._group_cache,
+            group_id,
+            self.GROUP_CACHE_TTL,
+            self.GROUP_CACHE_SIZE,
+            lambda: event.bot.get_group_info(group_id=group_id),
+        )
+
     @filter.event_message_type(filter.EventMessageType.ALL)
     async def on_notice(self, event: AiocqhttpMessageEvent):
         """监听通知事件 (贴表情)"""
@@ -247,20 +454,23 @@ class EmojiLikePlugin(Star):
             return
             
         # 1. 获取基础信息
-        user_id = str(raw_event.get("user_id"))
-        group_id = str(raw_event.get("group_id"))
+        # OneBot 原始字段即为 int：int 形式给 RPC，str 形式给日志/SID，各转换一次
+        uid_int = raw_event.get("user_id")
+        gid_int = raw_event.get("group_id")
+        user_id = str(uid_int)
+        group_id = str(gid_int)
         message_id = str(raw_event.get("message_id"))
         
         logger.debug(f"[QQ群贴表情监控插件] 解析到: user_id={user_id}, group_id={group_id}, emoji_id={emoji_id}, is_set={is_set}")
         
         # 0. 检查取消贴表情的监控策略
-        unmonitor_strategy = self.config.get("unmonitor_emoji_like_strategy", "关闭监控取消贴表情事件")
+        unmonitor_strategy = self._cfg.unmonitor_emoji_like_strategy
         if not is_set and unmonitor_strategy == "关闭监控取消贴表情事件":
             return
 
         # 监控机器人自身开关
         self_id = str(event.message_obj.self_id)
-        if user_id == self_id and not self.config.get("monitor_self", False):
+        if user_id == self_id and not self._cfg.monitor_self:
             logger.debug(f"[QQ群贴表情监控插件] 忽略机器人自身贴表情: {user_id}")
             return
 
@@ -268,9 +478,9 @@ class EmojiLikePlugin(Star):
         current_session_sid = f"napcat:GroupMessage:{group_id}"
         
         # 2. 检查全局监控范围（黑白名单）
-        blacklist = self.config.get("blacklist", [])
-        whitelist = self.config.get("whitelist", [])
-        
+        blacklist = self._cfg.blacklist
+        whitelist = self._cfg.whitelist
+
         if current_session_sid in blacklist:
             logger.debug(f"[QQ群贴表情监控插件] SID {current_session_sid} 在黑名单中")
             return
@@ -278,71 +488,81 @@ class EmojiLikePlugin(Star):
             logger.debug(f"[QQ群贴表情监控插件] SID {current_session_sid} 不在白名单中")
             return
 
+        # 既无推送目标、日志又不落 INFO 时，后续元数据拉取纯属浪费，直接返回
+        if not self._cfg.push_rules and not logger.isEnabledFor(logging.INFO):
+            return
+
         # 3. 获取相关人员信息、群信息和被贴消息内容
-        # 获取贴表情者的信息
-        try:
-            operator_info = await event.bot.get_group_member_info(group_id=int(group_id), user_id=int(user_id))
+        # 三次 OneBot 调用相互独立，并发发起，总耗时取最大 RTT 而非累加
+        operator_info, group_info, msg_info = await asyncio.gather(
+            self._get_member_info(event, gid_int, uid_int),
+            self._get_group_info(event, gid_int),
+            event.bot.get_msg(message_id=message_id),
+            return_exceptions=True,
+        )
+
+        # 贴表情者的信息
+        if isinstance(operator_info, BaseException):
+            logger.error(f"[QQ群贴表情监控插件] 获取群成员信息失败: {operator_info}")
+            full_operator_info = push_operator_info = f"未知 ({user_id})"
+        else:
             nickname = operator_info.get("nickname", "未知")
             card = operator_info.get("card", "")
             # 日志始终显示完整信息：nickname (card) (user_id)
             full_operator_name = f"{nickname} ({card})" if card else nickname
             full_operator_info = f"{full_operator_name} ({user_id})"
-            
+
             # 推送显示方式
-            op_display_mode = self.config.get("operator_display_mode", "全部显示")
+            op_display_mode = self._cfg.operator_display_mode
             if op_display_mode == "仅显示昵称和群名片":
                 push_operator_info = full_operator_name
             elif op_display_mode == "仅显示QQ号":
                 push_operator_info = user_id
             else: # 全部显示
                 push_operator_info = full_operator_info
-        except Exception as e:
-            logger.error(f"[QQ群贴表情监控插件] 获取群成员信息失败: {e}")
-            full_operator_info = push_operator_info = f"未知 ({user_id})"
-        
-        # 获取群信息
-        try:
-            group_info = await event.bot.get_group_info(group_id=int(group_id))
+
+        # 群信息
+        if isinstance(group_info, BaseException):
+            logger.error(f"[QQ群贴表情监控插件] 获取群信息失败: {group_info}")
+            full_group_info = push_group_info = f"({group_id})"
+        else:
             group_name = group_info.get("group_name", "未知群聊")
             # 日志始终显示完整信息：“group_name” (group_id)
             full_group_info = f"“{group_name}” ({group_id})"
-            
+
             # 推送显示方式
-            group_display_mode = self.config.get("group_display_mode", "全部显示")
+            group_display_mode = self._cfg.group_display_mode
             if group_display_mode == "仅显示群名":
                 push_group_info = f"“{group_name}”"
             elif group_display_mode == "仅显示群号":
                 push_group_info = group_id
             else: # 全部显示
                 push_group_info = full_group_info
-        except Exception as e:
-            logger.error(f"[QQ群贴表情监控插件] 获取群信息失败: {e}")
-            full_group_info = push_group_info = f"({group_id})"
-        
-        # 获取被贴消息内容
-        try:
-            msg_info = await event.bot.get_msg(message_id=message_id)
+
+        # 被贴消息内容
+        if isinstance(msg_info, BaseException):
+            logger.error(f"[QQ群贴表情监控插件] 获取消息内容失败: {msg_info}")
+            content = "未知消息内容"
+        else:
             msg_data = msg_info.get("message", [])
             content = ""
             if isinstance(msg_data, str):
                 content = msg_data
             elif isinstance(msg_data, list):
+                # 分段收集后一次 join，避免长消息上的二次方字符串拼接
+                parts: list[str] = []
                 for seg in msg_data:
                     if seg.get("type") == "text":
-                        content += seg.get("data", {}).get("text", "")
+                        parts.append(seg.get("data", {}).get("text", ""))
                     elif seg.get("type") == "face":
-                        content += f"[表情{seg.get('data', {}).get('id')}]"
+                        parts.append(f"[表情{seg.get('data', {}).get('id')}]")
                     else:
-                        content += f"[{seg.get('type')}]"
-        except Exception as e:
-            logger.error(f"[QQ群贴表情监控插件] 获取消息内容失败: {e}")
-            content = "未知消息内容"
+                        parts.append(f"[{seg.get('type')}]")
+                content = "".join(parts)
         
         # 4. 消息折叠处理
-        fold_threshold = self.config.get("msg_fold_threshold", 0)
-        if not isinstance(fold_threshold, int) or fold_threshold <= 0:
-            fold_threshold = 0
-            
+        fold_threshold = self._cfg.msg_fold_threshold
+
         display_content = content
         if fold_threshold > 0 and len(content) > fold_threshold:
             display_content = content[:fold_threshold] + "……"
@@ -359,48 +579,32 @@ class EmojiLikePlugin(Star):
             return
             
         # 推送时需要将 [表情id] 还原为 Face 组件，以便 QQ 原样显示
-        push_list = self.config.get("push_list", [])
-        logger.debug(f"[QQ群贴表情监控插件] 当前推送列表: {push_list}")
-        for push_item in push_list:
-            # 解析推送规则
-            # 格式可能为：
-            # 1. 推送目标SID (napcat:GroupMessage:12345678)
-            # 2. 推送目标SID:来源SID1,来源SID2... (napcat:GroupMessage:78787878:56565656,12345678)
-            
-            # 使用正则匹配以正确处理包含多个冒号的 SID (platform:type:id)
-            # 目标 SID 必定包含前三段，之后可能有冒号跟随来源列表
-            match = re.match(r'^((?:[^:]+:){2}[^:]+)(?::(.*))?$', push_item)
-            if not match:
-                logger.debug(f"[QQ群贴表情监控插件] 推送项格式不匹配: {push_item}")
-                continue
-                
-            target_sid = match.group(1)
-            sources_part = match.group(2)
-            
-            should_push = False
-            if not sources_part:
-                # 全局推送：只要消息在全局范围内（通过了黑白名单过滤），就推送
-                should_push = True
-                logger.debug(f"[QQ群贴表情监控插件] 推送项 {push_item} 为全局推送，目标: {target_sid}")
+        # 推送规则已在配置快照中预解析：空来源集合为全局推送，
+        # 否则检查当前会话 SID 或纯数字群号是否在来源集合中
+        targets = [
+            target_sid
+            for target_sid, sources in self._cfg.push_rules
+            if not sources or current_session_sid in sources or group_id in sources
+        ]
+        logger.debug(f"[QQ群贴表情监控插件] 匹配推送目标: {targets}")
+
+        if not targets:
+            return
+
+        # 推送内容对所有目标相同，MessageChain 只构造一次
+        chain = MessageChain()
+        chain.chain.append(Plain(f"{push_operator_info} 在 {push_group_info} 群中对消息“{display_content}”{action_text}"))
+        chain.chain.append(Face(id=int(emoji_id)))
+
+        results = await asyncio.gather(
+            *(self.context.send_message(target_sid, chain) for target_sid in targets),
+            return_exceptions=True,
+        )
+        for target_sid, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                logger.error(f"[QQ群贴表情监控插件] 发送推送消息至 {target_sid} 失败: {result}")
             else:
-                # 特定来源推送
-                source_sids = [s.strip() for s in sources_part.split(",")]
-                # 检查当前会话 SID 或纯数字群号是否在来源列表中
-                if current_session_sid in source_sids or group_id in source_sids:
-                    should_push = True
-                    logger.debug(f"[QQ群贴表情监控插件] 推送项 {push_item} 匹配到来源: {current_session_sid}")
-                else:
-                    logger.debug(f"[QQ群贴表情监控插件] 推送项 {push_item} 未匹配到来源: {current_session_sid}")
-            
-            if should_push:
-                chain = MessageChain()
-                chain.chain.append(Plain(f"{push_operator_info} 在 {push_group_info} 群中对消息“{display_content}”{action_text}"))
-                chain.chain.append(Face(id=int(emoji_id)))
-                try:
-                    await self.context.send_message(target_sid, chain)
-                    logger.debug(f"[QQ群贴表情监控插件] 已发送推送至 {target_sid}")
-                except Exception as e:
-                    logger.error(f"[QQ群贴表情监控插件] 发送推送消息失败: {e}")
+                logger.debug(f"[QQ群贴表情监控插件] 已发送推送至 {target_sid}")
 
     async def judge_emotion(
         self,
@@ -408,7 +612,49 @@ class EmojiLikePlugin(Star):
         text: str,
         image_urls: list[str] | None = None,
     ) -> str:
-        """LLM 情感判断"""
+        """LLM 情感判断（纯文本结果带 LRU 缓存与并发合并）"""
+        # 没有关键词就没有可选标签，任何判断结果都用不上
+        if not self.emotion_keywords:
+            return "其他"
+
+        # 带图消息内容多变，不缓存也不合并
+        if image_urls:
+            return await self._judge_emotion_uncached(event, text, image_urls, None)
+
+        cache_key = hashlib.blake2b(text[:512].encode(), digest_size=16).digest()
+        cached = self._emotion_cache.get(cache_key)
+        if cached is not None:
+            # 命中后重新插入，维持 LRU 序
+            self._emotion_cache[cache_key] = self._emotion_cache.pop(cache_key)
+            logger.debug(f"情感判断缓存命中: {cached}")
+            return cached
+
+        # 并发同文请求合并：后来者等待首个请求的 future，整批只发一次 provider 调用
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            logger.debug("情感判断合并到已在途的同文请求")
+            return await inflight
+
+        fut: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = fut
+        try:
+            label = await self._judge_emotion_uncached(event, text, None, cache_key)
+            fut.set_result(label)
+            return label
+        finally:
+            self._inflight.pop(cache_key, None)
+            if not fut.done():
+                # 请求方被取消（如超时）时让等待者回退默认值而不是悬挂
+                fut.set_result("其他")
+
+    async def _judge_emotion_uncached(
+        self,
+        event: AiocqhttpMessageEvent,
+        text: str,
+        image_urls: list[str] | None,
+        cache_key: bytes | None,
+    ) -> str:
+        """实际发起 provider 调用；成功结果写入 LRU 缓存"""
         system_prompt = (
             "你是一个情感分析专家，请判断文本情感，"
             f"只能从以下标签中选择一个：{self.emotion_keywords}"
@@ -416,7 +662,7 @@ class EmojiLikePlugin(Star):
         prompt = f"文本内容：{text}"
 
         provider = self.context.get_provider_by_id(
-            self.config["judge_provider_id"]
+            self._cfg.judge_provider_id
         ) or self.context.get_using_provider(event.unified_msg_origin)
 
         if not isinstance(provider, Provider):
@@ -429,7 +675,12 @@ class EmojiLikePlugin(Star):
                 prompt=prompt,
                 image_urls=image_urls,
             )
-            return resp.completion_text.strip()
+            label = resp.completion_text.strip()
+            if cache_key is not None:
+                if len(self._emotion_cache) >= self.EMOTION_CACHE_SIZE:
+                    del self._emotion_cache[next(iter(self._emotion_cache))]
+                self._emotion_cache[cache_key] = label
+            return label
         except Exception as e:
             logger.error(f"情感分析失败: {e}")
             return "其他"